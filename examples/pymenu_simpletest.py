@@ -68,7 +68,7 @@ def render_menu_item(item, render_index, is_active):
         item_row.append(" (disabled)")
 
     if item.value_fn:
-        value = item.value_fn(item)
+        value = menu.get_value(item)
         item_row.append("val: %s" % str(value))
 
     if item.child or callable(item.dynamic_fn):
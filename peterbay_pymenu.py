@@ -36,6 +36,10 @@ the first item is selected. Default is False.
 For showing if previous or next items are available, use render_scroll_up_fn
 and render_scroll_down_fn. Default is 255.
 
+```cached_values```: Return last known values from get_value instead of
+calling value_fn. Set by MenuSnapshot until the restored menu is
+refreshed. Default is False.
+
 The menu is adaptable by overriding these functions:
 
 ```pre_render_fn```: Called at the beginning of the render operation.
@@ -62,6 +66,30 @@ boundaries with ASCII characters.
 
 ```menu_exit_fn```: Called when menu is in top level and ACTION_BACK is called.
 
+```trace_fn```: Called at the beginning of action, action_hotkey and
+set_active with the name of the method and its arguments. Used by
+MenuTrace from ```peterbay_pymenu_trace``` for recording input traces.
+
+```redraw_fn```: Called with the menu core when a change of label, hotkey,
+data or disabled of a menu item in the visible window needs a redraw.
+Called once for all changes collected until render_changed or render is
+called. Changes of items outside the visible window only set the item's
+changed flag. If auto_render is False, it is also called when
+insert_before, insert_after, remove_item, move_item or replace_item
+change the visible window.
+
+The menu can be created in thread-safe mode with ```MenuCore(thread_safe=True)```
+(requires the ```threading``` module, e.g. on CPython). In this mode the input
+thread (action, action_hotkey, set_active, add_item) publishes each change
+of the menu structure atomically and the render thread takes a consistent
+snapshot of the visible window. No lock is held while user callbacks run.
+
+The navigation state can be kept over a soft reset or power cycle with
+MenuSnapshot from ```peterbay_pymenu_snapshot```.
+
+Dynamic submenus of the active item can be generated in advance with
+MenuPrefetch from ```peterbay_pymenu_prefetch``` (requires thread-safe mode).
+
 Menu Item
 --------------------
 
@@ -78,7 +106,10 @@ The menu item is adaptable by setting these parameters:
 The menu item is adaptable by overriding these functions:
 
 ```dynamic_fn```: Function called to dynamically create submenu items.
-Called before enter_fn.
+Called before enter_fn. When prefetched by MenuPrefetch from
+```peterbay_pymenu_prefetch```, it is called from a background thread with
+the same menu item. The items it adds are kept in a staging item until
+ACTION_ENTER attaches them.
 
 ```enter_fn```: Function called when menu item is selected.
 
@@ -86,7 +117,8 @@ Called before enter_fn.
 ACTION_BACK is called.
 
 ```value_fn```: Function called for obtaining item value. Called before
-render_title_fn.
+render_title_fn. Use ```get_value``` of the menu core in render_item_fn to
+keep the last known value for the snapshot.
 
 
 * Author(s): Petr Vavrin
@@ -99,6 +131,16 @@ Implementation Notes
 
 # imports
 
+try:
+    from threading import RLock, get_ident
+except ImportError:
+    RLock = None
+
+    def get_ident():
+        """Get identifier of the current thread (without threading)"""
+        return 0
+
+
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/peterbay/Peterbay_CircuitPython_PyMenu.git"
 
@@ -121,6 +163,9 @@ class MenuItem:
     :param MenuItem prev: Previous menu item (set in menu core)
     :param MenuItem next: Next menu item (set in menu core)
     :param MenuItem child: Child menu item (set in menu core)
+    :param MenuCore menu: Menu core notified about changes (set in menu core)
+    :param bool changed: Item was changed since it was last rendered
+    :param object value: Last known value of value_fn (set in menu core)
     """
 
     parent = None
@@ -128,11 +173,14 @@ class MenuItem:
     next = None
     child = None
     uid = None
-
-    label = ""
-    hotkey = None
-    data = None
-    disabled = None
+    menu = None
+    changed = False
+    value = None
+
+    _label = ""
+    _hotkey = None
+    _data = None
+    _disabled = None
     enter_fn = None
     leave_fn = None
     value_fn = None
@@ -143,22 +191,83 @@ class MenuItem:
         for key, value in kwargs.items():
             setattr(self, key, value)
 
+    def __changed(self):
+        if self.menu:
+            self.menu.item_changed(self)
+
+    @property
+    def label(self):
+        """Label of menu item"""
+        return self._label
+
+    @label.setter
+    def label(self, value):
+        self._label = value
+        self.__changed()
+
+    @property
+    def hotkey(self):
+        """Hotkey defined for menu item"""
+        return self._hotkey
+
+    @hotkey.setter
+    def hotkey(self, value):
+        self._hotkey = value
+        self.__changed()
+
+    @property
+    def data(self):
+        """Custom data of menu item"""
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self.__changed()
+
+    @property
+    def disabled(self):
+        """Disabled menu item (not selectable)"""
+        return self._disabled
+
+    @disabled.setter
+    def disabled(self, value):
+        self._disabled = value
+        self.__changed()
+
     def drop_reference(self):
         """Drop menu item reference"""
         self.prev = None
         self.next = None
         self.child = None
+        self.menu = None
+
+
+class _NullLock:
+    """Lock placeholder used when the menu is not in thread-safe mode"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
 
 
 class MenuCore:
     """Menu core class
 
+    :param bool thread_safe: Guard menu state with a lock (requires threading)
+
     :param bool auto_render: Auto render menu after action
     :param bool show_previous_items: Show previous items in menu
     :param bool circular: Enable circular navigation
     :param int rows_limit: Limit of rows in menu
+    :param bool cached_values: Use last known values in get_value
+    :param MenuPrefetch prefetch: Prefetch of dynamic submenus (set in MenuPrefetch)
 
     :param function menu_exit_fn: Callback function for menu exit
+    :param function redraw_fn: Callback function for scheduling a redraw
+    :param function trace_fn: Callback function for tracing input calls
     :param function pre_render_fn: Callback function for pre-render
     :param function post_render_fn: Callback function for post-render
     :param function render_scroll_up_fn: Callback function for scroll up
@@ -171,6 +280,11 @@ class MenuCore:
     __root_item = None
     __main_item = None
     __active_item = None
+    __lock = None
+    __window = None
+    __window_active = None
+    __pending = None
+    __staging = None
 
     ACTION_PREV = 1
     ACTION_NEXT = 2
@@ -181,6 +295,8 @@ class MenuCore:
     show_previous_items = True
     circular = False
     menu_exit_fn = None
+    redraw_fn = None
+    trace_fn = None
     pre_render_fn = None
     post_render_fn = None
     render_scroll_up_fn = None
@@ -188,9 +304,23 @@ class MenuCore:
     render_title_fn = None
     render_item_fn = None
     rows_limit = 255
+    cached_values = False
+    prefetch = None
 
-    def __init__(self):
+    def __init__(self, thread_safe=False):
         """Create menu core instance"""
+        self.thread_safe = thread_safe
+        if thread_safe:
+            if RLock is None:
+                raise RuntimeError("THREADING_NOT_SUPPORTED")
+            self.__lock = RLock()
+        else:
+            self.__lock = _NullLock()
+
+        self.__window = {}
+        self.__pending = {}
+        self.__staging = {}
+
         self.__root_item = MenuItem()
         self.__root_item.uid = 0
 
@@ -202,25 +332,23 @@ class MenuCore:
         """
         self.__check_item(menu_item)
 
-        menu_item.uid = self.__item_counter
-        self.__item_counter += 1
-
         if parent:
             self.__check_item(parent)
         else:
             parent = self.__root_item
 
-        menu_item.parent = parent
+        with self.__lock:
+            if self.__staging:
+                parent = self.__staging.get((get_ident(), parent), parent)
 
-        if parent.child:
-            child_item = parent.child
-            while child_item.next:
-                child_item = child_item.next
-            child_item.next = menu_item
-            menu_item.prev = child_item
+            self.__register(menu_item)
 
-        else:
-            parent.child = menu_item
+            prev_item = parent.child
+            if prev_item:
+                while prev_item.next:
+                    prev_item = prev_item.next
+
+            self.__link(menu_item, parent, prev_item, None)
 
     def add_items(self, parent, *args):
         """Add multiple menu items to the menu
@@ -243,14 +371,237 @@ class MenuCore:
             self.add_item(parent, item)
             hotkey += 1
 
+    def insert_before(self, ref_item, menu_item):
+        """Insert menu item (with its submenu) before another menu item
+
+        :param MenuItem ref_item: Menu item already added to the menu
+        :param MenuItem menu_item: Menu item to insert
+        """
+        self.__insert(ref_item, menu_item, False)
+
+    def insert_after(self, ref_item, menu_item):
+        """Insert menu item (with its submenu) after another menu item
+
+        :param MenuItem ref_item: Menu item already added to the menu
+        :param MenuItem menu_item: Menu item to insert
+        """
+        self.__insert(ref_item, menu_item, True)
+
+    def remove_item(self, menu_item):
+        """Remove menu item (with its submenu) from the menu
+
+        If the active item is removed, the next item, the previous item
+        or the parent item becomes active. When the last item of the top
+        level is removed, the menu is empty and renders no items until
+        items are added and init is called.
+
+        :param MenuItem menu_item: Menu item to remove
+        """
+        self.__check_linked(menu_item)
+
+        with self.__lock:
+            affected = self.__in_window(menu_item, menu_item.prev, menu_item.next)
+            fallback = menu_item.next or menu_item.prev
+            if not fallback and menu_item.parent.uid != 0:
+                fallback = menu_item.parent
+
+            affected = self.__move_away(menu_item, fallback) or affected
+            self.__unlink(menu_item)
+            menu_item.parent = None
+            self.__release(menu_item)
+
+        if affected:
+            self.__redraw()
+
+    def move_item(self, menu_item, ref_item, after=False):
+        """Move menu item (with its submenu) before or after another menu item
+
+        :param MenuItem menu_item: Menu item to move
+        :param MenuItem ref_item: Menu item to move before or after
+        :param bool after: Move after ref_item instead of before
+        """
+        self.__check_linked(menu_item)
+        self.__check_linked(ref_item)
+
+        with self.__lock:
+            item = ref_item
+            while item:
+                if item is menu_item:
+                    raise ValueError("WRONG_MENU_ITEM_POSITION")
+                item = item.parent
+
+            affected = self.__in_window(menu_item, menu_item.prev, menu_item.next)
+            self.__unlink(menu_item)
+
+            if after:
+                self.__link(menu_item, ref_item.parent, ref_item, ref_item.next)
+            else:
+                self.__link(menu_item, ref_item.parent, ref_item.prev, ref_item)
+
+            affected = self.__in_window(menu_item.prev, menu_item.next) or affected
+
+        if affected:
+            self.__redraw()
+
+    def replace_item(self, old_item, new_item):
+        """Replace menu item (with its submenu) by another menu item
+
+        If the active item is replaced, the new item becomes active.
+
+        :param MenuItem old_item: Menu item to replace
+        :param MenuItem new_item: Menu item to put at the same position
+        """
+        self.__check_linked(old_item)
+        self.__check_unlinked(new_item)
+
+        with self.__lock:
+            self.__register(new_item)
+            affected = self.__in_window(old_item)
+            self.__link(new_item, old_item.parent, old_item.prev, old_item.next)
+
+            affected = self.__move_away(old_item, new_item) or affected
+            old_item.parent = None
+            old_item.prev = None
+            old_item.next = None
+            self.__release(old_item)
+
+        if affected:
+            self.__redraw()
+
+    def __register(self, menu_item):
+        for item in self.__subtree(menu_item):
+            item.uid = self.__item_counter
+            self.__item_counter += 1
+            item.menu = self
+
+    def __link(self, menu_item, parent, prev_item, next_item):
+        menu_item.parent = parent
+        menu_item.prev = prev_item
+        menu_item.next = next_item
+
+        if prev_item:
+            prev_item.next = menu_item
+        else:
+            parent.child = menu_item
+
+        if next_item:
+            next_item.prev = menu_item
+
+    def __unlink(self, menu_item):
+        if menu_item.prev:
+            menu_item.prev.next = menu_item.next
+        else:
+            menu_item.parent.child = menu_item.next
+
+        if menu_item.next:
+            menu_item.next.prev = menu_item.prev
+
+        menu_item.prev = None
+        menu_item.next = None
+
+    def __insert(self, ref_item, menu_item, after):
+        self.__check_linked(ref_item)
+        self.__check_unlinked(menu_item)
+
+        with self.__lock:
+            self.__register(menu_item)
+
+            if after:
+                self.__link(menu_item, ref_item.parent, ref_item, ref_item.next)
+            else:
+                self.__link(menu_item, ref_item.parent, ref_item.prev, ref_item)
+
+            affected = self.__in_window(menu_item.prev, menu_item.next)
+
+        if affected:
+            self.__redraw()
+
+    def __is_linked(self, item):
+        return item.menu is self and item.parent is not None
+
+    def __check_linked(self, item):
+        self.__check_item(item)
+        if not self.__is_linked(item):
+            raise ValueError("MENU_ITEM_NOT_IN_MENU")
+
+    def __check_unlinked(self, item):
+        self.__check_item(item)
+        if item.menu or item.parent:
+            raise ValueError("MENU_ITEM_ALREADY_IN_MENU")
+
+    def __release(self, menu_item):
+        for item in self.__subtree(menu_item):
+            item.menu = None
+
+    def __subtree(self, menu_item):
+        item = menu_item
+        while item:
+            yield item
+            if item.child:
+                item = item.child
+                continue
+
+            while item is not menu_item and not item.next:
+                item = item.parent
+
+            item = None if item is menu_item else item.next
+
+    def __check_active(self):
+        if self.__active_item is None and not self.__root_item.child:
+            return None
+
+        self.__check_item(self.__active_item)
+        return self.__active_item
+
+    def __in_window(self, *items):
+        if self.__window is None:
+            return True
+
+        for item in items:
+            if item and item.uid in self.__window:
+                return True
+        return False
+
+    def __move_away(self, menu_item, fallback):
+        moved = False
+        item = self.__active_item
+        while item:
+            if item is menu_item:
+                self.__active_item = fallback
+                moved = True
+                break
+            item = item.parent
+
+        item = self.__main_item
+        while item:
+            if item is menu_item:
+                self.__main_item = fallback
+                break
+            item = item.parent
+
+        return moved
+
+    def __redraw(self):
+        if self.auto_render and (self.__active_item or not self.__root_item.child):
+            self.render()
+            return
+
+        with self.__lock:
+            schedule = not self.__pending and self.__window is not None
+            self.__window = None
+
+        if schedule and callable(self.redraw_fn):
+            self.redraw_fn(self)
+
     def init(self, initial_item):
         """Set initial menu item
 
         :param MenuItem initial_item: Initial menu item
         """
         self.__check_item(initial_item)
-        self.__main_item = initial_item
-        self.__active_item = initial_item
+        with self.__lock:
+            self.__main_item = initial_item
+            self.__active_item = initial_item
 
     def __check_item(self, item):
         if not isinstance(item, MenuItem):
@@ -258,67 +609,106 @@ class MenuCore:
 
     def reset(self):
         """Reset menu to the initial menu item"""
-        self.__check_item(self.__active_item)
-        self.__active_item = self.__main_item
+        with self.__lock:
+            self.__check_active()
+            self.__active_item = self.__main_item
 
     def __clear_childs(self, child_item):
         while True:
             next_item = child_item.next
+            self.__release(child_item)
             child_item.drop_reference()
             if next_item:
                 child_item = next_item
             else:
                 break
 
-    def action(self, key):
-        """Perform menu action
-
-        :param int key: Action key
-        """
-        active_item = self.__active_item
-        self.__check_item(active_item)
-
+    def __sibling(self, item, key):
         if key == self.ACTION_PREV:
-            if active_item.prev:
-                self.__active_item = active_item.prev
+            if item.prev:
+                return item.prev
 
-            elif self.circular:
-                while active_item.next:
-                    self.__active_item = active_item.next
+            if self.circular:
+                while item.next:
+                    item = item.next
 
-        elif key == self.ACTION_NEXT:
-            if active_item.next:
-                self.__active_item = active_item.next
+        elif item.next:
+            return item.next
 
-            elif self.circular:
-                while active_item.prev:
-                    self.__active_item = active_item.prev
+        elif self.circular:
+            while item.prev:
+                item = item.prev
 
-        elif key == self.ACTION_ENTER and not active_item.disabled:
-            if callable(active_item.dynamic_fn):
-                active_item.dynamic_fn(self, self.__active_item)
+        return item
 
-            if callable(active_item.enter_fn):
-                active_item.enter_fn(self.__active_item)
+    def __enter(self, active_item):
+        if callable(active_item.dynamic_fn):
+            staging = self.prefetch.take(active_item) if self.prefetch else None
+            if staging and not active_item.child:
+                if self.__attach(active_item, staging, None) is None:
+                    return
+            else:
+                active_item.dynamic_fn(self, active_item)
+
+        if callable(active_item.enter_fn):
+            active_item.enter_fn(active_item)
 
-            if active_item.child:
+        with self.__lock:
+            if active_item.child and self.__is_linked(active_item):
                 self.__active_item = active_item.child
 
-        elif key == self.ACTION_BACK:
-            parent = active_item.parent
+    def __back(self, active_item, parent):
+        detached = None
+
+        with self.__lock:
+            if active_item.parent is not parent or not self.__is_linked(active_item):
+                return False
+
             if callable(parent.dynamic_fn):
-                self.__clear_childs(parent.child)
+                detached = parent.child
                 parent.child = None
 
-            if callable(parent.leave_fn):
-                parent.leave_fn()
-
             if not parent.uid == 0:
                 self.__active_item = parent
 
-            elif callable(self.menu_exit_fn):
-                self.menu_exit_fn()
-                return
+        if detached:
+            self.__clear_childs(detached)
+
+        if callable(parent.leave_fn):
+            parent.leave_fn()
+
+        return parent.uid == 0 and callable(self.menu_exit_fn)
+
+    def action(self, key):
+        """Perform menu action
+
+        :param int key: Action key
+        """
+        if callable(self.trace_fn):
+            self.trace_fn("action", key)
+
+        self.__action(key)
+        self.__schedule_prefetch()
+
+    def __action(self, key):
+        with self.__lock:
+            active_item = self.__check_active()
+            if active_item and not self.__is_linked(active_item):
+                active_item = None
+            parent = active_item.parent if active_item else None
+
+            if active_item and key in (self.ACTION_PREV, self.ACTION_NEXT):
+                self.__active_item = self.__sibling(active_item, key)
+
+        if not active_item:
+            pass
+
+        elif key == self.ACTION_ENTER and not active_item.disabled:
+            self.__enter(active_item)
+
+        elif key == self.ACTION_BACK and self.__back(active_item, parent):
+            self.menu_exit_fn()
+            return
 
         if self.auto_render:
             self.render()
@@ -328,21 +718,25 @@ class MenuCore:
 
         :param str hotkey: Hotkey
         """
-        self.__check_item(self.__active_item)
-        item = self.__active_item.parent.child
+        if callable(self.trace_fn):
+            self.trace_fn("action_hotkey", hotkey)
 
-        while True:
-            if item.hotkey == hotkey:
-                if item.disabled:
-                    break
-                self.__active_item = item
-                self.action(self.ACTION_ENTER)
-                break
+        with self.__lock:
+            if not self.__check_active():
+                return
 
-            if not item.next:
-                break
+            item = self.__active_item.parent.child
 
-            item = item.next
+            while item and item.hotkey != hotkey:
+                item = item.next
+
+            if not item or item.disabled:
+                return
+
+            self.__active_item = item
+
+        self.__action(self.ACTION_ENTER)
+        self.__schedule_prefetch()
 
     def set_active(self, item, enter=False):
         """Set active menu item
@@ -350,55 +744,256 @@ class MenuCore:
         :param bool enter: Perform enter action
         """
         self.__check_item(item)
-        self.__active_item = item
+        if callable(self.trace_fn):
+            self.trace_fn("set_active", item, enter)
+
+        with self.__lock:
+            self.__active_item = item
+
         if enter:
-            self.action(self.ACTION_ENTER)
+            self.__action(self.ACTION_ENTER)
 
         elif self.auto_render:
             self.render()
 
+        self.__schedule_prefetch()
+
+    def __schedule_prefetch(self):
+        if self.prefetch:
+            self.prefetch.schedule(self.__active_item)
+
+    def __link_childs(self, parent, child_item):
+        parent.child = child_item
+        while child_item:
+            child_item.parent = parent
+            child_item = child_item.next
+
+    def get_value(self, item):
+        """Get value of menu item from value_fn and keep it as last known value
+
+        With cached_values, the last known value is returned when there
+        is one.
+
+        :param MenuItem item: Menu item
+        :return: Value or None
+        """
+        if self.cached_values and item.value is not None:
+            return item.value
+
+        if callable(item.value_fn):
+            item.value = item.value_fn(item)
+
+        return item.value
+
+    def generate_childs(self, item):
+        """Generate submenu of menu item by dynamic_fn without publishing it
+
+        dynamic_fn is called with the menu item itself, but the items it adds
+        to the menu item (from the calling thread) are linked to a staging
+        item instead. The submenu is published by attach_childs.
+
+        :param MenuItem item: Menu item with dynamic_fn
+        :return: Staging item holding the created items as childs
+        """
+        self.__check_item(item)
+        if not callable(item.dynamic_fn):
+            raise RuntimeError("MISSING_dynamic_fn_FUNCTION")
+
+        staging = MenuItem()
+        key = (get_ident(), item)
+        with self.__lock:
+            self.__staging[key] = staging
+
+        try:
+            item.dynamic_fn(self, item)
+
+        finally:
+            with self.__lock:
+                del self.__staging[key]
+
+        return staging
+
+    def attach_childs(self, parent, staging, active_item=None):
+        """Replace submenu of menu item by childs of staging item at once
+
+        If the active item was in the replaced submenu, active_item (or
+        the first item of the new submenu, or the parent) becomes active.
+
+        :param MenuItem parent: Menu item getting the new submenu
+        :param MenuItem staging: Staging item from generate_childs
+        :param MenuItem active_item: Active item when the active item is replaced
+        :return: True if the visible window was affected
+        """
+        self.__check_item(parent)
+        self.__check_item(staging)
+
+        affected = self.__attach(parent, staging, active_item)
+        if affected is None:
+            raise ValueError("MENU_ITEM_NOT_IN_MENU")
+        return affected
+
+    def __attach(self, parent, staging, active_item):
+        with self.__lock:
+            if not self.__is_linked(parent):
+                return None
+
+            detached = parent.child
+            moved = False
+            item = self.__active_item
+            while item and not moved:
+                moved = item.parent is parent
+                item = item.parent
+
+            self.__link_childs(parent, staging.child)
+            staging.child = None
+
+            if moved:
+                self.__active_item = active_item or parent.child or parent
+
+            window_active = self.__window_active
+            affected = moved or bool(window_active and window_active.parent is parent)
+
+        if detached:
+            self.__clear_childs(detached)
+
+        if affected:
+            self.__redraw()
+
+        return affected
+
+    def get_active_item(self):
+        """Get active menu item
+
+        :return: Active menu item
+        """
+        return self.__active_item
+
+    def __visible_window(self):
+        with self.__lock:
+            active_item = self.__check_active()
+            if not active_item:
+                self.__window = {}
+                self.__window_active = None
+                self.__pending = {}
+                return self.__root_item, None, [], False, False
+
+            parent = active_item.parent
+
+            rows_counter = self.rows_limit
+            if callable(self.render_title_fn):
+                rows_counter -= 1
+
+            if self.show_previous_items:
+                show_item = parent.child
+                scroll_up = False
+            else:
+                show_item = active_item
+                scroll_up = show_item.prev is not None
+
+            items = []
+            while True:
+                items.append(show_item)
+                rows_counter -= 1
+
+                if rows_counter <= 0 or not show_item.next:
+                    break
+
+                show_item = show_item.next
+
+            self.__window = {}
+            for render_index, window_item in enumerate(items):
+                self.__window[window_item.uid] = render_index
+                window_item.changed = False
+
+            self.__window_active = active_item
+            self.__pending = {}
+            parent.changed = False
+
+            return parent, active_item, items, scroll_up, show_item.next is not None
+
     def render(self):
         """Render menu"""
         if not callable(self.render_item_fn):
             raise RuntimeError("MISSING_render_item_fn_FUNCTION")
 
-        self.__check_item(self.__active_item)
-        parent = self.__active_item.parent
+        parent, active_item, items, scroll_up, scroll_down = self.__visible_window()
 
         if callable(self.pre_render_fn):
             self.pre_render_fn((parent.uid == 0))
 
-        show_item = self.__active_item
-        rows_counter = self.rows_limit
-        render_index = 0
-
         if callable(self.render_title_fn):
-            parent_value = None
-            if callable(parent.value_fn):
-                parent_value = parent.value_fn(parent)
+            self.render_title_fn(parent, self.get_value(parent))
 
-            self.render_title_fn(parent, parent_value)
-            rows_counter -= 1
-
-        if self.show_previous_items:
-            show_item = show_item.parent.child
-
-        elif show_item.prev and callable(self.render_scroll_up_fn):
+        if scroll_up and callable(self.render_scroll_up_fn):
             self.render_scroll_up_fn()
 
-        while True:
-            is_active = show_item.uid == self.__active_item.uid
+        for render_index, show_item in enumerate(items):
+            is_active = show_item.uid == active_item.uid
             self.render_item_fn(show_item, render_index, is_active)
-            render_index += 1
-            rows_counter -= 1
 
-            if rows_counter <= 0 or not show_item.next:
-                break
-
-            show_item = show_item.next
-
-        if show_item.next and callable(self.render_scroll_down_fn):
+        if scroll_down and callable(self.render_scroll_down_fn):
             self.render_scroll_down_fn()
 
         if callable(self.post_render_fn):
             self.post_render_fn((parent.uid == 0))
+
+    def item_changed(self, item):
+        """Collect change of menu item, called by MenuItem on attribute change
+
+        Item in the visible window is scheduled for redraw and redraw_fn is
+        called once for all changes collected before the next redraw.
+
+        :param MenuItem item: Changed menu item
+        """
+        item.changed = True
+
+        with self.__lock:
+            active_item = self.__window_active
+            if not active_item:
+                return
+
+            window = self.__window
+            schedule = not self.__pending and window is not None
+
+            if item is active_item.parent:
+                self.__window = None
+
+            elif window is not None and item.uid in window:
+                self.__pending[item.uid] = item
+
+            else:
+                return
+
+        if schedule and callable(self.redraw_fn):
+            self.redraw_fn(self)
+
+    def render_changed(self):
+        """Redraw changed rows of the visible window
+
+        The whole menu is rendered when the title item was changed, when
+        the active item was moved or when the visible window was changed
+        by adding, removing or moving items.
+
+        :return: True if anything was rendered
+        """
+        with self.__lock:
+            active_item = self.__window_active
+            moved = active_item and self.__active_item is not active_item
+            if self.__window is None or moved:
+                full_render = True
+            else:
+                full_render = False
+                rows = [
+                    (self.__window[uid], item) for uid, item in self.__pending.items()
+                ]
+                self.__pending = {}
+
+        if full_render:
+            self.render()
+            return True
+
+        for render_index, item in rows:
+            item.changed = False
+            self.render_item_fn(item, render_index, item.uid == active_item.uid)
+
+        return len(rows) > 0
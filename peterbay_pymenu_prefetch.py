@@ -0,0 +1,172 @@
+# SPDX-FileCopyrightText: 2023 Petr Vavrin <pvavrin@gmail.com>
+# SPDX-FileCopyrightText: Copyright (c) 2023 Petr Vavrin
+#
+# SPDX-License-Identifier: MIT
+"""
+`peterbay_pymenu_prefetch`
+================================================================================
+
+Speculative prefetch of dynamic submenus for peterbay_pymenu.
+
+Menu Prefetch
+--------------------
+
+MenuPrefetch generates the submenu of the active item with dynamic_fn in
+a background thread when the item stays active for ```dwell``` seconds.
+ACTION_ENTER then attaches the prefetched submenu at once instead of
+calling dynamic_fn. When ACTION_ENTER comes while the prefetch is running,
+it waits for it. The prefetch is cancelled when the active item changes.
+When ```limit``` prefetches are already running, the prefetch of the active
+item starts when one of them finishes.
+
+dynamic_fn is called from the background thread with the same menu item
+as for ACTION_ENTER. The items it adds to the menu item are kept in
+a staging item (see ```generate_childs``` of MenuCore) until they are
+attached. When dynamic_fn raises an exception, nothing is kept and
+ACTION_ENTER calls dynamic_fn again.
+
+Requires a menu core created with ```MenuCore(thread_safe=True)```.
+
+
+* Author(s): Petr Vavrin
+
+Implementation Notes
+--------------------
+
+
+"""
+
+# imports
+
+try:
+    from threading import Event, Lock, Timer
+except ImportError:
+    Event = Lock = Timer = None
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/peterbay/Peterbay_CircuitPython_PyMenu.git"
+
+
+class MenuPrefetch:
+    """Prefetch of dynamic submenus
+
+    :param MenuCore menu: Menu core in thread-safe mode
+    :param float dwell: Seconds the active item must stay active before prefetch
+    :param int limit: Limit of prefetches running at the same time
+    """
+
+    def __init__(self, menu, dwell, limit=1):
+        """Create menu prefetch instance and attach it to the menu core"""
+        if Timer is None or not menu.thread_safe:
+            raise RuntimeError("PREFETCH_REQUIRES_THREAD_SAFE")
+
+        self.menu = menu
+        self.dwell = dwell
+        self.limit = limit
+
+        self.__lock = Lock()
+        self.__item = None
+        self.__timer = None
+        self.__event = None
+        self.__staging = None
+        self.__capped = False
+        self.__running = 0
+        self.__token = 0
+
+        menu.prefetch = self
+
+    def schedule(self, item):
+        """Schedule prefetch of the active item, called by menu core
+
+        :param MenuItem item: Active menu item
+        """
+        with self.__lock:
+            if item is self.__item:
+                return
+
+            self.__cancel()
+
+            if not item or item.disabled or item.child or not callable(item.dynamic_fn):
+                return
+
+            self.__item = item
+            self.__timer = Timer(self.dwell, self.__run, (item, self.__token))
+            self.__timer.daemon = True
+            self.__timer.start()
+
+    def take(self, item):
+        """Take prefetched submenu, called by menu core on ACTION_ENTER
+
+        :param MenuItem item: Entered menu item
+        :return: Staging item holding the submenu or None
+        """
+        with self.__lock:
+            if item is not self.__item:
+                return None
+
+            self.__timer.cancel()
+            event = self.__event
+
+        if event:
+            event.wait()
+
+        with self.__lock:
+            if item is not self.__item:
+                return None
+
+            staging = self.__staging
+            self.__staging = None
+            self.__cancel()
+
+        return staging
+
+    def cancel(self):
+        """Cancel scheduled prefetch and drop prefetched submenu"""
+        with self.__lock:
+            self.__cancel()
+
+    def __cancel(self):
+        if self.__timer:
+            self.__timer.cancel()
+
+        if self.__event:
+            self.__event.set()
+
+        self.__token += 1
+        self.__item = None
+        self.__timer = None
+        self.__event = None
+        self.__staging = None
+        self.__capped = False
+
+    def __run(self, item, token):
+        with self.__lock:
+            if token != self.__token:
+                return
+
+            if self.__running >= self.limit:
+                self.__capped = True
+                return
+
+            self.__running += 1
+            self.__event = event = Event()
+
+        try:
+            staging = self.menu.generate_childs(item)
+
+        except Exception:  # pylint: disable=broad-except
+            # nothing is kept, ACTION_ENTER calls dynamic_fn again
+            staging = None
+
+        with self.__lock:
+            self.__running -= 1
+            if staging and token == self.__token:
+                self.__staging = staging
+
+            if self.__capped:
+                self.__capped = False
+                self.__timer = Timer(0, self.__run, (self.__item, self.__token))
+                self.__timer.daemon = True
+                self.__timer.start()
+
+        event.set()
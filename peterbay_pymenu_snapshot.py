@@ -0,0 +1,250 @@
+# SPDX-FileCopyrightText: 2023 Petr Vavrin <pvavrin@gmail.com>
+# SPDX-FileCopyrightText: Copyright (c) 2023 Petr Vavrin
+#
+# SPDX-License-Identifier: MIT
+"""
+`peterbay_pymenu_snapshot`
+================================================================================
+
+Warm-boot snapshot of navigation state for peterbay_pymenu.
+
+Menu Snapshot
+--------------------
+
+MenuSnapshot keeps the navigation state over a soft reset or power cycle.
+```snapshot()``` returns small JSON bytes (e.g. for NVM) with the index and
+label of the active item and of each of its parents. With ```values=True```,
+the last known values of the title and of the visible rows are added.
+Numbers, strings, booleans, lists and tuples are kept, other values are
+stored as strings. Values of at most ```rows_limit``` rows are stored and
+when the snapshot would be longer than ```size_limit``` bytes, the values
+are left out. The path itself is not limited.
+
+After the menu is built and initialized again, ```restore(snapshot)```
+moves the cursor back and renders the first frame right away. The label
+of each item on the path is checked, restore stops at the first level
+which does not match. A dynamic submenu on the path is not generated,
+the active item is shown as a placeholder item. When the restored item is
+the one which was active, the last known values are used instead of
+value_fn.
+
+```refresh()``` is the step the application schedules after restore
+(e.g. from a background thread with a thread-safe menu or from the idle
+loop). It generates the dynamic submenu into a staging item, replaces
+the placeholder at once and turns the cached values off. If the cursor
+already left the placeholder, it is not moved.
+
+
+* Author(s): Petr Vavrin
+
+Implementation Notes
+--------------------
+
+
+"""
+
+# imports
+
+import json
+
+from peterbay_pymenu import MenuItem
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/peterbay/Peterbay_CircuitPython_PyMenu.git"
+
+
+def _json_value(value):
+    if isinstance(value, tuple):
+        return {"t": [_json_value(item) for item in value]}
+    if isinstance(value, list):
+        return [_json_value(item) for item in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _value(value):
+    if isinstance(value, dict):
+        return tuple(_value(item) for item in value["t"])
+    if isinstance(value, list):
+        return [_value(item) for item in value]
+    return value
+
+
+def _index_of(item):
+    index = 0
+    while item.prev:
+        item = item.prev
+        index += 1
+    return index
+
+
+def _find_child(parent, index, label):
+    item = parent.child
+    while item and index:
+        item = item.next
+        index -= 1
+
+    if item and item.label == label:
+        return item
+
+    item = parent.child
+    while item and item.label != label:
+        item = item.next
+    return item
+
+
+class MenuSnapshot:
+    """Navigation state snapshot
+
+    :param MenuCore menu: Menu core
+
+    :param int rows_limit: Limit of rows with stored values
+    :param int size_limit: Limit of snapshot size in bytes for storing values
+    """
+
+    rows_limit = 8
+    size_limit = 256
+
+    def __init__(self, menu):
+        """Create menu snapshot instance"""
+        self.menu = menu
+        self.__pending = None
+
+    def snapshot(self, values=False):
+        """Create snapshot of navigation state
+
+        :param bool values: Add last known values of the title and visible rows
+        :return: Snapshot as bytes
+        """
+        active_item = self.menu.get_active_item()
+        path = []
+        item = active_item
+        while item and item.parent:
+            path.insert(0, [_index_of(item), item.label])
+            item = item.parent
+
+        data = {"p": path}
+        snapshot = json.dumps(data).encode()
+
+        if values and active_item:
+            window = {}
+            item = active_item
+            if self.menu.show_previous_items:
+                item = active_item.parent.child
+
+            index = _index_of(item)
+            for _ in range(min(self.menu.rows_limit, self.rows_limit)):
+                if not item:
+                    break
+                if item.value is not None:
+                    window[index] = _json_value(item.value)
+                item = item.next
+                index += 1
+
+            data["v"] = [_json_value(active_item.parent.value), window]
+            with_values = json.dumps(data).encode()
+            if len(with_values) <= self.size_limit:
+                snapshot = with_values
+
+        return snapshot
+
+    def restore(self, snapshot):
+        """Restore navigation state from snapshot and render the first frame
+
+        :param bytes snapshot: Snapshot created by snapshot method
+        :return: True if the cursor was restored
+        """
+        if isinstance(snapshot, bytes):
+            snapshot = snapshot.decode()
+        data = json.loads(snapshot)
+
+        item = self.menu.get_active_item()
+        if not item:
+            return False
+
+        while item.parent:
+            item = item.parent
+
+        self.__pending = None
+        target = None
+        rows = {}
+        last = len(data["p"]) - 1
+        restored = False
+
+        for depth, (index, label) in enumerate(data["p"]):
+            if not item.child and callable(item.dynamic_fn):
+                target = MenuItem(label=label)
+                self.menu.add_item(item, target)
+                self.__pending = (item, target, data["p"][depth:])
+                rows = {str(index): target}
+                restored = depth == last
+                break
+
+            item = _find_child(item, index, label)
+            if not item:
+                break
+
+            target = item
+
+        else:
+            restored = True
+
+        if not target:
+            return False
+
+        if restored and "v" in data:
+            self.__set_values(target, rows, data["v"])
+
+        self.menu.set_active(target)
+        return True
+
+    def __set_values(self, target, rows, values):
+        title_value, window = values
+        self.menu.cached_values = True
+        target.parent.value = _value(title_value)
+
+        if not rows:
+            item = target.parent.child
+            while item:
+                rows[str(_index_of(item))] = item
+                item = item.next
+
+        for index, value in window.items():
+            if index in rows:
+                rows[index].value = _value(value)
+
+    def refresh(self):
+        """Generate the submenu replaced by placeholder and refresh values"""
+        pending = self.__pending
+        self.__pending = None
+        self.menu.cached_values = False
+        rendered = False
+
+        if pending:
+            parent, placeholder, path = pending
+            if placeholder.menu is self.menu and callable(parent.dynamic_fn):
+                staging = self.menu.generate_childs(parent)
+                target = self.__resolve(staging, path)
+                rendered = self.menu.attach_childs(parent, staging, target)
+
+        if not rendered and self.menu.auto_render:
+            self.menu.render()
+
+    def __resolve(self, staging, path):
+        item = staging
+        target = None
+
+        for index, label in path:
+            if item is not staging and not item.child:
+                if not callable(item.dynamic_fn):
+                    break
+                self.menu.attach_childs(item, self.menu.generate_childs(item))
+
+            item = _find_child(item, index, label)
+            if not item:
+                break
+
+            target = item
+
+        return target
@@ -0,0 +1,346 @@
+# SPDX-FileCopyrightText: 2023 Petr Vavrin <pvavrin@gmail.com>
+# SPDX-FileCopyrightText: Copyright (c) 2023 Petr Vavrin
+#
+# SPDX-License-Identifier: MIT
+"""
+`peterbay_pymenu_trace`
+================================================================================
+
+Input trace recorder and replay harness for peterbay_pymenu.
+
+Menu Trace
+--------------------
+
+MenuTrace records timestamped calls of ```action```, ```action_hotkey``` and
+```set_active``` from a running MenuCore. Menu items are recorded by path
+(index of the item and its parents), together with the path of the active
+item when recording started and before each call. The trace can be saved
+with ```dumps()``` and loaded with ```MenuTrace.loads()```.
+
+Menu Replay
+--------------------
+
+MenuReplay replays a trace against a menu definition. The definition is
+a function that receives a new MenuCore, adds the menu items to it and
+calls ```init```, so each replay starts from the same state. The active
+item is then moved to the recorded starting path (entering dynamic items
+on the way). When the definition does not set ```render_item_fn```, the
+menu is rendered headless.
+
+Replay runs at full speed by default or at the recorded pace with
+```realtime=True```. The report contains per-action latency percentiles
+(p50/p95/p99), render counts, time spent in callbacks, the path of the
+active item after each step and the indexes of events where the replayed
+menu diverged from the recorded one.
+
+
+* Author(s): Petr Vavrin
+
+Implementation Notes
+--------------------
+
+
+"""
+
+# imports
+
+import json
+import time
+
+from peterbay_pymenu import MenuCore
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/peterbay/Peterbay_CircuitPython_PyMenu.git"
+
+_MENU_CALLBACKS = (
+    "menu_exit_fn",
+    "redraw_fn",
+    "pre_render_fn",
+    "post_render_fn",
+    "render_scroll_up_fn",
+    "render_scroll_down_fn",
+    "render_title_fn",
+    "render_item_fn",
+)
+
+_ITEM_CALLBACKS = ("enter_fn", "leave_fn", "value_fn", "dynamic_fn")
+
+_ADD_METHODS = ("add_item", "insert_before", "insert_after", "replace_item")
+
+
+def item_path(item):
+    """Get path of menu item (indexes of the item and its parents)
+
+    :param MenuItem item: Menu item
+    :return: List of indexes from the top level, empty for None
+    """
+    path = []
+    while item and item.parent:
+        index = 0
+        sibling = item.prev
+        while sibling:
+            sibling = sibling.prev
+            index += 1
+
+        path.insert(0, index)
+        item = item.parent
+
+    return path
+
+
+def find_path(menu, path, enter=False):
+    """Find menu item by path
+
+    :param MenuCore menu: Menu core
+    :param list path: List of indexes from the top level
+    :param bool enter: Enter items with dynamic_fn to create their submenu
+    :return: Menu item or None
+    """
+    item = menu.get_active_item()
+    while item and item.parent:
+        item = item.parent
+
+    for index in path:
+        if not item:
+            return None
+
+        if enter and not item.child and callable(item.dynamic_fn):
+            menu.set_active(item, True)
+
+        item = item.child
+        while item and index:
+            item = item.next
+            index -= 1
+
+    return item
+
+
+def percentile(values, percent):
+    """Get percentile of values (nearest rank)
+
+    :param list values: Sorted values
+    :param int percent: Percentile (0 - 100)
+    :return: Value or None for empty values
+    """
+    if not values:
+        return None
+
+    rank = (len(values) * percent + 99) // 100
+    return values[max(rank, 1) - 1]
+
+
+def _replay_event(menu, event, latencies):
+    _, method, args, active_path = event
+    matched = item_path(menu.get_active_item()) == active_path
+
+    if method == "set_active":
+        item = find_path(menu, args[0])
+        if not item:
+            return False
+        args = [item, args[1]]
+
+    call_start = time.monotonic_ns()
+    getattr(menu, method)(*args)
+    latency = time.monotonic_ns() - call_start
+
+    latencies.setdefault(method, []).append(latency)
+    latencies.setdefault("all", []).append(latency)
+    return matched
+
+
+class MenuTrace:
+    """Menu input trace
+
+    :param list events: Recorded events, each one is a list of time in
+        nanoseconds from the start of recording, method name, arguments
+        and path of the active item before the call
+    :param list start: Path of the active item when recording started
+    """
+
+    events = None
+    start = None
+
+    __menu = None
+    __start = None
+
+    def __init__(self, events=None, start=None):
+        """Create menu trace instance"""
+        self.events = events if events is not None else []
+        self.start = start if start is not None else []
+
+    def attach(self, menu):
+        """Start recording input calls of the menu
+
+        :param MenuCore menu: Menu core
+        """
+        self.__menu = menu
+        self.__start = time.monotonic_ns()
+        self.start = item_path(menu.get_active_item())
+        menu.trace_fn = self.record
+
+    def detach(self):
+        """Stop recording input calls"""
+        if self.__menu:
+            self.__menu.trace_fn = None
+            self.__menu = None
+
+    def record(self, method, *args):
+        """Record input call, used as trace_fn of the menu
+
+        :param str method: Name of the menu method
+        :param args: Arguments of the menu method
+        """
+        if method == "set_active":
+            args = (item_path(args[0]), args[1])
+
+        self.events.append(
+            [
+                time.monotonic_ns() - self.__start,
+                method,
+                list(args),
+                item_path(self.__menu.get_active_item()),
+            ]
+        )
+
+    def dumps(self):
+        """Serialize trace to string
+
+        :return: JSON string
+        """
+        return json.dumps({"start": self.start, "events": self.events})
+
+    @classmethod
+    def loads(cls, data):
+        """Create trace from serialized string
+
+        :param str data: JSON string
+        :return: MenuTrace instance
+        """
+        data = json.loads(data)
+        return cls(data["events"], data["start"])
+
+
+class MenuReplay:
+    """Menu trace replay
+
+    :param function build_fn: Function adding menu items to the menu core
+        and calling its init, called with the new MenuCore instance
+    :param bool thread_safe: Create menu core in thread-safe mode
+    """
+
+    def __init__(self, build_fn, thread_safe=False):
+        """Create menu replay instance"""
+        self.build_fn = build_fn
+        self.thread_safe = thread_safe
+
+        self.__callback_depth = 0
+        self.__callback_ns = 0
+        self.__renders = 0
+        self.__partial_renders = 0
+
+    def run(self, trace, realtime=False):
+        """Replay trace on a new menu
+
+        :param MenuTrace trace: Trace to replay
+        :param bool realtime: Keep recorded pace between events
+        :return: Report dictionary
+        """
+        menu = self.__build()
+        start_item = find_path(menu, trace.start, True)
+        if start_item and start_item.parent:
+            menu.set_active(start_item)
+
+        self.__callback_depth = 0
+        self.__callback_ns = 0
+        self.__renders = 0
+        self.__partial_renders = 0
+
+        report = {
+            "events": len(trace.events),
+            "latency": {},
+            "active": [],
+            "diverged": [],
+        }
+        start = time.monotonic_ns()
+
+        for event_index, event in enumerate(trace.events):
+            if realtime:
+                delay = event[0] - (time.monotonic_ns() - start)
+                if delay > 0:
+                    time.sleep(delay / 1000000000)
+
+            if not _replay_event(menu, event, report["latency"]):
+                report["diverged"].append(event_index)
+
+            report["active"].append(item_path(menu.get_active_item()))
+
+        report["renders"] = self.__renders
+        report["partial_renders"] = self.__partial_renders
+        report["callback_ns"] = self.__callback_ns
+
+        for method, values in report["latency"].items():
+            values.sort()
+            report["latency"][method] = {
+                "p50": percentile(values, 50),
+                "p95": percentile(values, 95),
+                "p99": percentile(values, 99),
+                "max": values[-1],
+            }
+
+        return report
+
+    def __build(self):
+        menu = MenuCore(thread_safe=self.thread_safe)
+
+        for name in _ADD_METHODS:
+            setattr(menu, name, self.__wrap_add(getattr(menu, name)))
+
+        self.build_fn(menu)
+
+        if not callable(menu.render_item_fn):
+            menu.render_item_fn = lambda item, render_index, is_active: None
+
+        for name in _MENU_CALLBACKS:
+            callback = getattr(menu, name)
+            if callable(callback):
+                setattr(menu, name, self.__wrap_callback(callback))
+
+        for name, partial in (("render", False), ("render_changed", True)):
+            setattr(menu, name, self.__wrap_render(getattr(menu, name), partial))
+        return menu
+
+    def __wrap_add(self, method):
+        def wrapper(*args):
+            item = args[-1]
+            for name in _ITEM_CALLBACKS:
+                callback = getattr(item, name)
+                if callable(callback):
+                    setattr(item, name, self.__wrap_callback(callback))
+
+            return method(*args)
+
+        return wrapper
+
+    def __wrap_render(self, method, partial):
+        def wrapper():
+            if partial:
+                self.__partial_renders += 1
+            else:
+                self.__renders += 1
+
+            return method()
+
+        return wrapper
+
+    def __wrap_callback(self, callback):
+        def wrapper(*args):
+            self.__callback_depth += 1
+            call_start = time.monotonic_ns()
+            try:
+                return callback(*args)
+            finally:
+                self.__callback_depth -= 1
+                if not self.__callback_depth:
+                    self.__callback_ns += time.monotonic_ns() - call_start
+
+        return wrapper